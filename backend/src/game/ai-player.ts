@@ -1,12 +1,7 @@
 import { Logger } from '@nestjs/common';
 import { PlayerPosition, Suit } from './entities/game.entity';
 import { max } from 'class-validator';
-
-export interface Card {
-  color: Suit | 'bird';
-  value: number;
-  id: string;
-}
+import { Card, SUITS, cardIndex } from './cards';
 
 export interface CompletedTrick {
   winner: PlayerPosition;
@@ -20,6 +15,24 @@ export interface CurrentTrick {
   leadSuit: Suit | null;
 }
 
+/**
+ * Bitmask of the values held in a suit (bit n set for value n)
+ */
+function suitValueMask(cards: Card[], suit: Suit): number {
+  let mask = 0;
+  for (const card of cards) {
+    if (card.color === suit) mask |= 1 << card.value;
+  }
+  return mask;
+}
+
+/**
+ * Bitmask of every value above the given one, up to 14
+ */
+function higherValuesMask(value: number): number {
+  return ((1 << 15) - 1) & ~((1 << (value + 1)) - 1);
+}
+
 export class AIPlayer {
   private readonly logger = new Logger(AIPlayer.name);
   private position: PlayerPosition;
@@ -27,6 +40,7 @@ export class AIPlayer {
   private centerPileTopCard: Card | null;
   private discardedCards: Card[];
   private completedTricks: CompletedTrick[];
+  private playedCards: Card[]; // Cards from completedTricks, rebuilt whenever they change
   private trumpSuit: Suit | null;
   private selectedTrumpSuit: Suit | null;
   private highBidder: PlayerPosition | null;
@@ -38,6 +52,7 @@ export class AIPlayer {
     this.centerPileTopCard = null;
     this.discardedCards = [];
     this.completedTricks = [];
+    this.playedCards = [];
     this.trumpSuit = null;
     this.selectedTrumpSuit = null;
     this.highBidder = null;
@@ -70,6 +85,7 @@ export class AIPlayer {
    */
   updateCompletedTricks(tricks: CompletedTrick[]): void {
     this.completedTricks = [...tricks];
+    this.playedCards = tricks.flatMap(t => t.cards.map(c => c.card));
     // Track non-trump suits the bidder has played
     if (this.highBidder && this.trumpSuit) {
       for (const trick of tricks) {
@@ -207,35 +223,32 @@ export class AIPlayer {
     this.selectedTrumpSuit = bestTrumpSuit;
     
     const cardsToKeep: Card[] = [];
-    const cardsRemaining: Card[] = [...allCards];
     
     // Phase 2: Keep ALL trump cards (including bird and red-1 if in trump color)
-    const trumpCards = cardsRemaining.filter(card => 
-      card.color === bestTrumpSuit || 
-      card.color === 'bird' || 
-      (card.color === 'red' && card.value === 1)
-    );
-    cardsToKeep.push(...trumpCards);
-    trumpCards.forEach(card => {
-      const idx = cardsRemaining.findIndex(c => c.id === card.id);
-      if (idx >= 0) cardsRemaining.splice(idx, 1);
-    });
-    
     // Phase 3: Keep ALL 14s regardless of suit (these are unbeatable when trumps exhausted)
-    const fourteens = cardsRemaining.filter(card => card.value === 14);
-    cardsToKeep.push(...fourteens);
-    fourteens.forEach(card => {
-      const idx = cardsRemaining.findIndex(c => c.id === card.id);
-      if (idx >= 0) cardsRemaining.splice(idx, 1);
-    });
+    // Partition in a single pass rather than splicing each kept card out of the remainder
+    const trumpCards: Card[] = [];
+    const fourteens: Card[] = [];
+    const cardsRemaining: Card[] = [];
+    for (const card of allCards) {
+      if (card.color === bestTrumpSuit || 
+          card.color === 'bird' || 
+          (card.color === 'red' && card.value === 1)) {
+        trumpCards.push(card);
+      } else if (card.value === 14) {
+        fourteens.push(card);
+      } else {
+        cardsRemaining.push(card);
+      }
+    }
+    cardsToKeep.push(...trumpCards, ...fourteens);
     
     // Phase 4: For remaining slots, minimize number of suits
     // Group remaining cards by suit and evaluate each suit's value
     const spaceLeft = 9 - cardsToKeep.length;
     
     if (spaceLeft > 0) {
-      const offSuits = (['red', 'black', 'green', 'yellow'] as Suit[])
-        .filter(suit => suit !== bestTrumpSuit);
+      const offSuits = SUITS.filter(suit => suit !== bestTrumpSuit);
       
       // Evaluate each suit and score it for keeping
       const suitEvaluations = offSuits.map(suit => {
@@ -290,12 +303,6 @@ export class AIPlayer {
           cardsToKeep.push(...toAdd);
           cardsAdded += toAdd.length;
         }
-        
-        // Remove added cards from remaining
-        cardsToKeep.forEach(card => {
-          const idx = cardsRemaining.findIndex(c => c.id === card.id);
-          if (idx >= 0) cardsRemaining.splice(idx, 1);
-        });
       }
     }
     
@@ -556,7 +563,7 @@ export class AIPlayer {
         return playableCards[0].id;
       } else {
         // Opponents winning, try to take it back
-        const winningCards = playableCards.filter(c => this.canBeatTrick(c, currentTrick));
+        const winningCards = this.getWinningCards(playableCards, currentTrick);
         if (winningCards.length > 0) {
           // Take trick with lowest winning card
           winningCards.sort((a, b) => this.cardValue(a) - this.cardValue(b));
@@ -735,7 +742,7 @@ export class AIPlayer {
       
       if (!myTeamWinning) {
         // Opponents winning, check if we can beat them
-        const canBeat = playableCards.some(c => this.canBeatTrick(c, currentTrick));
+        const canBeat = this.getWinningCards(playableCards, currentTrick).length > 0;
         if (!canBeat) {
           // Can't win, avoid points at all costs
           const nonPointCards = playableCards.filter(c => !this.isPointCard(c));
@@ -786,11 +793,10 @@ export class AIPlayer {
       
       if (!partnerHasPlayed) {
         // Partner hasn't played yet
-        const canWin = playableCards.some(c => this.canBeatTrick(c, currentTrick));
+        const winningCards = this.getWinningCards(playableCards, currentTrick);
         
-        if (canWin) {
+        if (winningCards.length > 0) {
           // I can take the trick
-          const winningCards = playableCards.filter(c => this.canBeatTrick(c, currentTrick));
           winningCards.sort((a, b) => this.cardValue(a) - this.cardValue(b));
           return winningCards[0].id;
         } else {
@@ -821,7 +827,6 @@ export class AIPlayer {
           const cardsNotHigh = !this.isLikelyHighCard(leadCard, currentTrick);
           
           // Check if bidding team is currently winning (opponents to us)
-          const currentWinner = this.getCurrentTrickWinner(currentTrick);
           const biddingTeamWinning = currentWinner === this.highBidder || currentWinner === this.getPartner(this.highBidder!);
           
           if (cardsNotHigh && !biddingTeamWinning) {
@@ -878,7 +883,7 @@ export class AIPlayer {
           return playableCards[0].id;
         } else {
           // Opponents winning, try to take it
-          const winningCards = playableCards.filter(c => this.canBeatTrick(c, currentTrick));
+          const winningCards = this.getWinningCards(playableCards, currentTrick);
           if (winningCards.length > 0) {
             winningCards.sort((a, b) => this.cardValue(a) - this.cardValue(b));
             return winningCards[0].id;
@@ -1150,15 +1155,16 @@ export class AIPlayer {
   }
 
   /**
-   * Check if a card can beat the current trick
+   * Get the cards that can beat the current trick
+   * (the trick's winning card is determined once for all candidates)
    */
-  private canBeatTrick(card: Card, trick: CurrentTrick): boolean {
-    if (trick.cards.length === 0) return true;
+  private getWinningCards(cards: Card[], trick: CurrentTrick): Card[] {
+    if (trick.cards.length === 0) return [...cards];
     
     const currentWinner = this.getCurrentTrickWinner(trick);
     const winningCard = trick.cards.find(c => c.player === currentWinner)!.card;
     
-    return this.cardBeats(card, winningCard, trick.leadSuit);
+    return cards.filter(c => this.cardBeats(c, winningCard, trick.leadSuit));
   }
 
   /**
@@ -1172,16 +1178,11 @@ export class AIPlayer {
     
     // Check if higher cards in this suit have been played
     const suit = card.color as Suit;
-    const seenCards = [...this.completedTricks.flatMap(t => t.cards.map(c => c.card)), 
-                       ...trick.cards.map(c => c.card)];
-    
-    // Check if all higher cards in suit have been seen
-    for (let v = card.value + 1; v <= 14; v++) {
-      const higherCardSeen = seenCards.some(c => c.color === suit && c.value === v);
-      if (!higherCardSeen) return false; // Higher card still out there
-    }
+    const seenCards = [...this.playedCards, ...trick.cards.map(c => c.card)];
     
-    return true; // All higher cards have been played
+    // All higher cards in suit must have been seen
+    const higher = higherValuesMask(card.value);
+    return (suitValueMask(seenCards, suit) & higher) === higher;
   }
 
   /**
@@ -1266,34 +1267,13 @@ export class AIPlayer {
     if (!this.trumpSuit) return null;
     
     // Get all cards that have been played
-    const seenCards = this.completedTricks.flatMap(t => t.cards.map(c => c.card));
-    
-    // Build list of all possible trump cards in order (highest to lowest)
-    const allPossibleTrumps = [
-      { color: 'red' as const, value: 1 },  // red-1 (trump value 100)
-      { color: 'bird' as const, value: 0 }, // bird (trump value 90)
-      ...Array.from({ length: 10 }, (_, i) => ({ color: this.trumpSuit!, value: 14 - i })) // 14 down to 5
-    ];
+    const seen = new Set(this.playedCards.map(cardIndex));
     
     // Find the highest unplayed trump
-    for (const potentialTrump of allPossibleTrumps) {
-      const hasBeenPlayed = seenCards.some(c => 
-        (potentialTrump.color === 'bird' && c.color === 'bird') ||
-        (potentialTrump.color === 'red' && c.color === 'red' && c.value === 1) ||
-        (potentialTrump.color !== 'bird' && potentialTrump.color !== 'red' && 
-         c.color === potentialTrump.color && c.value === potentialTrump.value)
-      );
-      
-      if (!hasBeenPlayed) {
+    for (const potentialTrump of this.allTrumpsDescending()) {
+      if (!seen.has(cardIndex(potentialTrump))) {
         // This is the highest unplayed trump - check if I have it
-        const card = this.hand.find(c =>
-          (potentialTrump.color === 'bird' && c.color === 'bird') ||
-          (potentialTrump.color === 'red' && c.color === 'red' && c.value === 1) ||
-          (potentialTrump.color !== 'bird' && potentialTrump.color !== 'red' && 
-           c.color === potentialTrump.color && c.value === potentialTrump.value)
-        );
-        
-        return card || null;
+        return this.findInHand(potentialTrump) || null;
       }
     }
     
@@ -1308,31 +1288,12 @@ export class AIPlayer {
     if (!this.trumpSuit) return [];
     
     // Get all cards that have been played
-    const seenCards = this.completedTricks.flatMap(t => t.cards.map(c => c.card));
-    
-    // Build list of all possible trump cards in order (highest to lowest)
-    const allPossibleTrumps = [
-      { color: 'red' as const, value: 1 },  // red-1 (trump value 100)
-      { color: 'bird' as const, value: 0 }, // bird (trump value 90)
-      ...Array.from({ length: 10 }, (_, i) => ({ color: this.trumpSuit!, value: 14 - i })) // 14 down to 5
-    ];
+    const seen = new Set(this.playedCards.map(cardIndex));
     
     // Find the highest two unplayed trumps
-    const highestTwoUnplayed: Array<{ color: Suit | 'bird' | 'red'; value: number }> = [];
-    
-    for (const potentialTrump of allPossibleTrumps) {
-      const hasBeenPlayed = seenCards.some(c => 
-        (potentialTrump.color === 'bird' && c.color === 'bird') ||
-        (potentialTrump.color === 'red' && c.color === 'red' && c.value === 1) ||
-        (potentialTrump.color !== 'bird' && potentialTrump.color !== 'red' && 
-         c.color === potentialTrump.color && c.value === potentialTrump.value)
-      );
-      
-      if (!hasBeenPlayed) {
-        highestTwoUnplayed.push(potentialTrump);
-        if (highestTwoUnplayed.length === 2) break;
-      }
-    }
+    const highestTwoUnplayed = this.allTrumpsDescending()
+      .filter(potentialTrump => !seen.has(cardIndex(potentialTrump)))
+      .slice(0, 2);
     
     if (highestTwoUnplayed.length < 2) return [];
     
@@ -1340,12 +1301,7 @@ export class AIPlayer {
     const cardsIHave: Card[] = [];
     
     for (const trump of highestTwoUnplayed) {
-      const card = this.hand.find(c =>
-        (trump.color === 'bird' && c.color === 'bird') ||
-        (trump.color === 'red' && c.color === 'red' && c.value === 1) ||
-        (trump.color !== 'bird' && trump.color !== 'red' && 
-         c.color === trump.color && c.value === trump.value)
-      );
+      const card = this.findInHand(trump);
       
       if (card) {
         cardsIHave.push(card);
@@ -1366,48 +1322,47 @@ export class AIPlayer {
     
     const cardTrumpValue = this.trumpValue(card);
     
-    // Get all cards that have been played
-    const seenCards = [...this.completedTricks.flatMap(t => t.cards.map(c => c.card)), 
-                       ...trick.cards.map(c => c.card)];
-    
-    // Check if any higher trump is still outstanding (not seen and not in my hand)
-    const allTrumpCards = [
-      { color: 'red' as const, value: 1 },  // red-1 (trump value 100)
-      { color: 'bird' as const, value: 0 }, // bird (trump value 90)
-      ...Array.from({ length: 10 }, (_, i) => ({ color: this.trumpSuit!, value: 14 - i })) // 14 down to 5
-    ];
+    // Cards that have been played or are in my hand are not outstanding
+    const accountedFor = new Set([
+      ...this.playedCards.map(cardIndex),
+      ...trick.cards.map(c => cardIndex(c.card)),
+      ...this.hand.map(cardIndex),
+    ]);
     
-    for (const potentialTrump of allTrumpCards) {
+    // Check if any higher trump is still outstanding
+    for (const potentialTrump of this.allTrumpsDescending()) {
       const potentialValue = potentialTrump.color === 'red' && potentialTrump.value === 1 ? 100 :
                              potentialTrump.color === 'bird' ? 90 :
                              potentialTrump.value;
       
-      if (potentialValue > cardTrumpValue) {
-        // This is a higher trump - check if it's outstanding
-        const hasBeenSeen = seenCards.some(c => 
-          (potentialTrump.color === 'bird' && c.color === 'bird') ||
-          (potentialTrump.color === 'red' && c.color === 'red' && c.value === 1) ||
-          (potentialTrump.color !== 'bird' && potentialTrump.color !== 'red' && 
-           c.color === potentialTrump.color && c.value === potentialTrump.value)
-        );
-        
-        const inMyHand = this.hand.some(c =>
-          (potentialTrump.color === 'bird' && c.color === 'bird') ||
-          (potentialTrump.color === 'red' && c.color === 'red' && c.value === 1) ||
-          (potentialTrump.color !== 'bird' && potentialTrump.color !== 'red' && 
-           c.color === potentialTrump.color && c.value === potentialTrump.value)
-        );
-        
-        if (!hasBeenSeen && !inMyHand) {
-          // Higher trump is still outstanding
-          return false;
-        }
+      if (potentialValue > cardTrumpValue && !accountedFor.has(cardIndex(potentialTrump))) {
+        // Higher trump is still outstanding
+        return false;
       }
     }
     
     return true; // No higher trump is outstanding
   }
 
+  /**
+   * List every trump card (color and value) from highest to lowest
+   */
+  private allTrumpsDescending(): Array<{ color: Suit | 'bird'; value: number }> {
+    return [
+      { color: 'red', value: 1 },  // red-1 (trump value 100)
+      { color: 'bird', value: 0 }, // bird (trump value 90)
+      ...Array.from({ length: 10 }, (_, i) => ({ color: this.trumpSuit!, value: 14 - i })) // 14 down to 5
+    ];
+  }
+
+  /**
+   * Find the card in my hand with the given color and value
+   */
+  private findInHand(target: { color: Suit | 'bird'; value: number }): Card | undefined {
+    const index = cardIndex(target);
+    return this.hand.find(c => cardIndex(c) === index);
+  }
+
   /**
    * Check if a non-trump card is the highest outstanding card in its suit
    * Returns true if no higher card of the same color exists (not played and not in my hand)
@@ -1419,26 +1374,12 @@ export class AIPlayer {
     const cardValue = card.value;
     
     // Get all cards that have been played
-    const seenCards = [...this.completedTricks.flatMap(t => t.cards.map(c => c.card)), 
-                       ...trick.cards.map(c => c.card)];
-    
-    // Check if any higher card of the same suit is still outstanding
-    for (let value = cardValue + 1; value <= 14; value++) {
-      const hasBeenSeen = seenCards.some(c => 
-        c.color === cardSuit && c.value === value
-      );
-      
-      const inMyHand = this.hand.some(c =>
-        c.color === cardSuit && c.value === value
-      );
-      
-      if (!hasBeenSeen && !inMyHand) {
-        // Higher card in this suit is still outstanding
-        return false;
-      }
-    }
+    const seenCards = [...this.playedCards, ...trick.cards.map(c => c.card)];
     
-    return true; // No higher card in this suit is outstanding
+    // Every higher card of the same suit must be either seen or in my hand
+    const higher = higherValuesMask(cardValue);
+    const accountedFor = suitValueMask(seenCards, cardSuit) | suitValueMask(this.hand, cardSuit);
+    return (accountedFor & higher) === higher;
   }
 
   /**
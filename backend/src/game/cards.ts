@@ -0,0 +1,20 @@
+import { Suit } from './entities/game.entity';
+
+export interface Card {
+  color: Suit | 'bird';
+  value: number;
+  id: string;
+}
+
+export const SUITS: readonly Suit[] = ['red', 'black', 'green', 'yellow'];
+const SUIT_INDEX: Record<Suit, number> = { red: 0, black: 1, green: 2, yellow: 3 };
+
+/**
+ * Map a card to a compact number (0-41) identifying its color and value.
+ * Suited 5-14 cards are 0-39, red 1 is 40 and the bird is 41.
+ */
+export function cardIndex(card: Pick<Card, 'color' | 'value'>): number {
+  if (card.color === 'bird') return 41;
+  if (card.color === 'red' && card.value === 1) return 40;
+  return SUIT_INDEX[card.color] * 10 + (card.value - 5);
+}
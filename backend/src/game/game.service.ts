@@ -4,12 +4,7 @@ import { Repository, DataSource } from 'typeorm';
 import { Game, GameState, PlayerPosition, PlayerType, Suit } from './entities/game.entity';
 import { Table } from '../tables/entities/table.entity';
 import { AIPlayer } from './ai-player';
-
-interface Card {
-  color: Suit | 'bird';
-  value: number;
-  id: string;
-}
+import { Card, SUITS, cardIndex } from './cards';
 
 interface GameStateData {
   hands: Record<PlayerPosition, Card[]>;
@@ -35,6 +30,23 @@ interface GameStateData {
   discardedCards: Card[];
 }
 
+// Seating order used for dealing, bidding and play
+const SEAT_ORDER: readonly PlayerPosition[] = ['south', 'west', 'north', 'east'];
+const SEAT_INDEX: Record<PlayerPosition, number> = { south: 0, west: 1, north: 2, east: 3 };
+
+// Point value of every card, indexed by cardIndex()
+const CARD_POINTS = (() => {
+  const points = new Uint8Array(42);
+  for (const color of SUITS) {
+    points[cardIndex({ color, value: 5 })] = 5;
+    points[cardIndex({ color, value: 10 })] = 10;
+    points[cardIndex({ color, value: 14 })] = 10;
+  }
+  points[cardIndex({ color: 'red', value: 1 })] = 30;
+  points[cardIndex({ color: 'bird', value: 0 })] = 20;
+  return points;
+})();
+
 @Injectable()
 export class GameService implements OnModuleInit {
   private readonly logger = new Logger(GameService.name);
@@ -555,13 +567,14 @@ export class GameService implements OnModuleInit {
       }
 
       // Keep selected cards, discard others
-      const selectedCards = hand.filter(card => selectedCardIds.includes(card.id));
+      const selectedIds = new Set(selectedCardIds);
+      const selectedCards = hand.filter(card => selectedIds.has(card.id));
       if (selectedCards.length !== 9) {
         throw new BadRequestException('Invalid card selection');
       }
 
       // Store the 6 discarded cards (the ones not selected from the 15-card hand)
-      const discarded = hand.filter(c => !selectedCardIds.includes(c.id));
+      const discarded = hand.filter(c => !selectedIds.has(c.id));
 
       // Store discarded cards in game state
       game.gameState.discardedCards = discarded;
@@ -670,17 +683,18 @@ export class GameService implements OnModuleInit {
       }
 
       const hand = game.gameState.hands[player];
-      const card = hand.find(c => c.id === cardId);
+      const handIndex = hand.findIndex(c => c.id === cardId);
 
-      if (!card) {
+      if (handIndex < 0) {
         throw new BadRequestException('Card not in hand');
       }
+      const card = hand[handIndex];
 
       // Validate card can be played according to rules
       this.validateCardPlay(card, hand, currentTrick, game.trumpSuit);
 
       // Remove card from hand
-      game.gameState.hands[player] = hand.filter(c => c.id !== cardId);
+      hand.splice(handIndex, 1);
 
       // Add card to current trick
       currentTrick.cards.push({ player, card });
@@ -730,16 +744,7 @@ export class GameService implements OnModuleInit {
         // Check if hand is complete (9 tricks)
         if (game.gameState.completedTricks.length === 9) {
           // Calculate hand points including discarded cards
-          let northSouthPoints = 0;
-          let eastWestPoints = 0;
-
-          for (const trick of game.gameState.completedTricks) {
-            if (trick.winner === 'north' || trick.winner === 'south') {
-              northSouthPoints += trick.points;
-            } else {
-              eastWestPoints += trick.points;
-            }
-          }
+          let { northSouthPoints, eastWestPoints } = this.tallyTeamPoints(game.gameState.completedTricks);
 
           // Add discarded cards points to the last trick winner
           if (game.gameState.discardedCards && game.gameState.discardedCards.length > 0) {
@@ -1080,11 +1085,10 @@ export class GameService implements OnModuleInit {
 
   private createDeck(): Card[] {
     const deck: Card[] = [];
-    const colors: Suit[] = ['red', 'black', 'green', 'yellow'];
     let cardId = 0;
 
     // Add numbered cards 5-14 for each color
-    for (const color of colors) {
+    for (const color of SUITS) {
       for (let value = 5; value <= 14; value++) {
         deck.push({ color, value, id: `${color}-${value}-${cardId++}` });
       }
@@ -1109,7 +1113,7 @@ export class GameService implements OnModuleInit {
     this.shuffleDeck(deck);
 
     const gameState = this.initializeGameState();
-    let cardIndex = 0;
+    let deckIndex = 0;
 
     const startPlayer = this.getNextPlayer(dealer);
     const dealOrder = this.getDealOrder(startPlayer);
@@ -1117,28 +1121,26 @@ export class GameService implements OnModuleInit {
     // First 5 rounds: each player gets 1, centerPile gets 1 face down
     for (let round = 0; round < 5; round++) {
       for (const player of dealOrder) {
-        gameState.hands[player].push(deck[cardIndex++]);
+        gameState.hands[player].push(deck[deckIndex++]);
       }
-      gameState.centerPile.faceDown.push(deck[cardIndex++]);
+      gameState.centerPile.faceDown.push(deck[deckIndex++]);
     }
 
     // Next 4 rounds: each player gets 1
     for (let round = 0; round < 4; round++) {
       for (const player of dealOrder) {
-        gameState.hands[player].push(deck[cardIndex++]);
+        gameState.hands[player].push(deck[deckIndex++]);
       }
     }
 
     // Last card to centerPile face up
-    gameState.centerPile.faceUp = deck[cardIndex++];
+    gameState.centerPile.faceUp = deck[deckIndex++];
 
     return gameState;
   }
 
   private getNextPlayer(currentPlayer: PlayerPosition): PlayerPosition {
-    const order: PlayerPosition[] = ['south', 'west', 'north', 'east'];
-    const currentIndex = order.indexOf(currentPlayer);
-    return order[(currentIndex + 1) % 4];
+    return SEAT_ORDER[(SEAT_INDEX[currentPlayer] + 1) % 4];
   }
 
   private getPartner(player: PlayerPosition): PlayerPosition {
@@ -1164,19 +1166,17 @@ export class GameService implements OnModuleInit {
   }
 
   private getDealOrder(startPlayer: PlayerPosition): PlayerPosition[] {
-    const order: PlayerPosition[] = ['south', 'west', 'north', 'east'];
-    const startIndex = order.indexOf(startPlayer);
-    return [...order.slice(startIndex), ...order.slice(0, startIndex)];
+    const startIndex = SEAT_INDEX[startPlayer];
+    return [...SEAT_ORDER.slice(startIndex), ...SEAT_ORDER.slice(0, startIndex)];
   }
 
   private getNextActiveBidder(currentPlayer: PlayerPosition, passedPlayers: Set<PlayerPosition>): PlayerPosition {
-    const order: PlayerPosition[] = ['south', 'west', 'north', 'east'];
-    const currentIndex = order.indexOf(currentPlayer);
+    const currentIndex = SEAT_INDEX[currentPlayer];
     
     // Try up to 4 times to find next active player
     for (let i = 1; i <= 4; i++) {
       const nextIndex = (currentIndex + i) % 4;
-      const nextPlayer = order[nextIndex];
+      const nextPlayer = SEAT_ORDER[nextIndex];
       if (!passedPlayers.has(nextPlayer)) {
         return nextPlayer;
       }
@@ -1325,15 +1325,31 @@ export class GameService implements OnModuleInit {
   private calculateTrickPoints(cards: Array<{ player: PlayerPosition; card: Card }>): number {
     let points = 0;
     for (const { card } of cards) {
-      if (card.value === 5) points += 5;
-      else if (card.value === 10) points += 10;
-      else if (card.value === 14) points += 10;
-      else if (card.color === 'bird') points += 20;
-      else if (card.color === 'red' && card.value === 1) points += 30;
+      points += CARD_POINTS[cardIndex(card)];
     }
     return points;
   }
 
+  /**
+   * Total the trick points taken by each team
+   */
+  private tallyTeamPoints(
+    completedTricks: GameStateData['completedTricks']
+  ): { northSouthPoints: number; eastWestPoints: number } {
+    let northSouthPoints = 0;
+    let eastWestPoints = 0;
+
+    for (const trick of completedTricks) {
+      if (trick.winner === 'north' || trick.winner === 'south') {
+        northSouthPoints += trick.points;
+      } else {
+        eastWestPoints += trick.points;
+      }
+    }
+
+    return { northSouthPoints, eastWestPoints };
+  }
+
   private validateCardPlay(
     card: Card, 
     hand: Card[], 
@@ -1652,18 +1668,24 @@ export class GameService implements OnModuleInit {
       const playerHand = game.gameState.hands[player];
       
       // Get all played cards (from completedTricks and discardedCards)
-      const playedCards = new Set<string>();
+      const playedCards = new Set<number>();
       for (const trick of game.gameState.completedTricks) {
         for (const { card } of trick.cards) {
-          playedCards.add(`${card.color}-${card.value}`);
+          playedCards.add(cardIndex(card));
         }
       }
       for (const card of game.gameState.discardedCards) {
-        playedCards.add(`${card.color}-${card.value}`);
+        playedCards.add(cardIndex(card));
       }
 
       // Get opponent positions
       const partner = this.getPartner(player);
+
+      // Index the cards held by player and partner so lookups below are O(1)
+      const teamCards = new Set<number>();
+      for (const card of [...playerHand, ...game.gameState.hands[partner]]) {
+        teamCards.add(cardIndex(card));
+      }
       const opponents: PlayerPosition[] = ['north', 'east', 'south', 'west'].filter(
         pos => pos !== player && pos !== partner
       ) as PlayerPosition[];
@@ -1690,7 +1712,7 @@ export class GameService implements OnModuleInit {
 
         // Check all cards with higher values in the same color
         for (let value = cardValue + 1; value <= 14; value++) {
-          const higherCardKey = `${cardColor}-${value}`;
+          const higherCardKey = cardIndex({ color: cardColor, value });
           
           // Check if this card has been played
           if (playedCards.has(higherCardKey)) {
@@ -1698,12 +1720,7 @@ export class GameService implements OnModuleInit {
           }
 
           // Check if player or partner has this card
-          const playerHasIt = playerHand.some(c => c.color === cardColor && c.value === value);
-          const partnerHasIt = game.gameState.hands[partner].some(
-            c => c.color === cardColor && c.value === value
-          );
-
-          if (playerHasIt || partnerHasIt) {
+          if (teamCards.has(higherCardKey)) {
             continue; // Player or partner has it, so it's fine
           }
 
@@ -1761,10 +1778,8 @@ export class GameService implements OnModuleInit {
         for (const pos of positions) {
           const hand = game.gameState.hands[pos];
           if (hand.length > 0) {
-            const cardToPlay = hand[0]; // Just play the first card
-            
-            // Remove from hand
-            game.gameState.hands[pos] = hand.filter(c => c.id !== cardToPlay.id);
+            // Just play the first card, removing it from the hand
+            const cardToPlay = hand.shift()!;
             
             // Add to current trick
             game.gameState.currentTrick.cards.push({
@@ -1802,16 +1817,7 @@ export class GameService implements OnModuleInit {
       }
 
       // Calculate final hand results
-      let northSouthPoints = 0;
-      let eastWestPoints = 0;
-
-      for (const trick of game.gameState.completedTricks) {
-        if (trick.winner === 'north' || trick.winner === 'south') {
-          northSouthPoints += trick.points;
-        } else {
-          eastWestPoints += trick.points;
-        }
-      }
+      const { northSouthPoints, eastWestPoints } = this.tallyTeamPoints(game.gameState.completedTricks);
 
       const biddingTeam = (game.highBidder === 'north' || game.highBidder === 'south') 
         ? 'northSouth' 